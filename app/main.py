@@ -1,9 +1,23 @@
 from flask import Flask, render_template, request
+from flask_caching import Cache
+from flask_compress import Compress
+from dbutils.pooled_db import PooledDB
 import pymysql
+import hashlib
 import os
+import re
+from datetime import datetime
 
 app = Flask(__name__)
 
+# Gzip responses over 500 bytes. Compiled templates need no setup - Jinja
+# caches them by default and Flask only auto-reloads them in debug mode
+app.config.update(
+    COMPRESS_ALGORITHM='gzip',
+    COMPRESS_MIN_SIZE=500
+)
+Compress(app)
+
 # Database configuration
 DB_CONFIG = {
     'host': os.getenv('DB_HOST', 'db'),
@@ -13,9 +27,141 @@ DB_CONFIG = {
     'database': os.getenv('DB_NAME', 'nyc311')
 }
 
+# Redis cache for query results - only changes when the ETL runs, which clears
+# every key under CACHE_KEY_PREFIX
+app.config.update(
+    CACHE_TYPE=os.getenv('CACHE_TYPE', 'RedisCache'),
+    CACHE_REDIS_HOST=os.getenv('REDIS_HOST', 'redis'),
+    CACHE_REDIS_PORT=int(os.getenv('REDIS_PORT', 6379)),
+    CACHE_KEY_PREFIX='nyc311:',
+    CACHE_DEFAULT_TIMEOUT=300
+)
+if app.config['CACHE_TYPE'] == 'RedisCache':
+    # Fail fast and fall back to MySQL if Redis is unreachable
+    app.config['CACHE_OPTIONS'] = {'socket_connect_timeout': 1, 'socket_timeout': 1}
+cache = Cache(app)
+
+# Search results per page (CI lowers it so the fixture spans several pages)
+PAGE_SIZE = int(os.getenv('PAGE_SIZE', 50))
+
+# InnoDB FULLTEXT defaults - shorter words and stopwords are not indexed, so
+# searches using them fall back to LIKE
+FULLTEXT_MIN_TOKEN_SIZE = 3
+FULLTEXT_STOPWORDS = {
+    'a', 'about', 'an', 'are', 'as', 'at', 'be', 'by', 'com', 'de', 'en', 'for',
+    'from', 'how', 'i', 'in', 'is', 'it', 'la', 'of', 'on', 'or', 'that', 'the',
+    'this', 'to', 'was', 'what', 'when', 'where', 'who', 'will', 'with', 'und', 'www'
+}
+
+# Browser/proxy caching (Cache-Control max-age, seconds) per endpoint - the
+# data only changes when the ETL runs
+HTTP_CACHE_MAX_AGE = {
+    'aggregate': 600,
+    'index': 60
+}
+
+# SQL for each search filter, in WHERE clause order
+SEARCH_FILTERS = {
+    'date_from': "created_date >= %s",
+    'date_to': "created_date <= %s",
+    'borough': "borough = %s",
+    'complaint_match': "MATCH(complaint_type) AGAINST (%s IN BOOLEAN MODE)",
+    'complaint_like': "complaint_type LIKE %s"
+}
+
+# Search results are cached briefly, keyed on the normalized query (WHERE clause + params)
+QUERY_CACHE_TIMEOUT = 120
+
+# Connection pool - reuses connections across requests instead of a new
+# MySQL handshake per page load. Connections are opened lazily so the app
+# can start before the database is up.
+POOL = PooledDB(
+    creator=pymysql,
+    maxconnections=20,
+    maxcached=8,
+    blocking=True,  # wait for a free connection instead of raising
+    ping=1,  # ping (and reconnect) when a connection is checked out
+    cursorclass=pymysql.cursors.DictCursor,
+    **DB_CONFIG
+)
+
 def get_db_connection():
-    """Create database connection"""
-    return pymysql.connect(**DB_CONFIG, cursorclass=pymysql.cursors.DictCursor)
+    """Check out a pooled database connection (returned to the pool on close)"""
+    return POOL.connection()
+
+@cache.memoize(timeout=3600)
+def get_boroughs():
+    """Distinct boroughs for the search dropdown"""
+    with get_db_connection() as conn, conn.cursor() as cursor:
+        cursor.execute("SELECT DISTINCT borough FROM service_requests ORDER BY borough")
+        return [row['borough'] for row in cursor.fetchall()]
+
+@cache.memoize(timeout=QUERY_CACHE_TIMEOUT, hash_method=hashlib.blake2b)
+def count_requests(where_sql, params):
+    """Total matching rows - keyed without the page, so flipping pages reuses the count"""
+    with get_db_connection() as conn, conn.cursor() as cursor:
+        cursor.execute("SELECT COUNT(*) as total FROM service_requests WHERE " + where_sql, params)
+        return cursor.fetchone()['total']
+
+@cache.memoize(timeout=QUERY_CACHE_TIMEOUT, hash_method=hashlib.blake2b)
+def fetch_requests_page(where_sql, params, limit, offset=0, after=None, before=None):
+    """One page of matching rows, newest first.
+
+    after/before are (created_date, unique_key) keyset cursors: the page seeks
+    straight past the cursor row on the (created_date, unique_key) index instead
+    of scanning and discarding OFFSET rows.
+    """
+    order = "DESC"
+    # Spelled out rather than as a row comparison, which MySQL won't use as a
+    # range after the borough prefix of idx_borough_created
+    if after:
+        where_sql += " AND (created_date < %s OR (created_date = %s AND unique_key < %s))"
+        params += (after[0],) + after
+    elif before:
+        # Walk backwards from the cursor, then flip the page back to newest first
+        where_sql += " AND (created_date > %s OR (created_date = %s AND unique_key > %s))"
+        params += (before[0],) + before
+        order = "ASC"
+
+    data_query = """
+        SELECT unique_key, created_date, closed_date, agency, complaint_type,
+               descriptor, borough, latitude, longitude
+        FROM service_requests
+        WHERE """ + where_sql + """
+        ORDER BY created_date """ + order + """, unique_key """ + order + """
+        LIMIT %s OFFSET %s
+    """
+    with get_db_connection() as conn, conn.cursor() as cursor:
+        cursor.execute(data_query, params + (limit, offset))
+        results = list(cursor.fetchall())
+
+    if before:
+        results.reverse()
+    return results
+
+def parse_page_cursor(value):
+    """Parse a 'YYYY-MM-DD HH:MM:SS_unique_key' page cursor, None if missing or invalid"""
+    created_date, _, unique_key = value.rpartition('_')
+    try:
+        return datetime.strptime(created_date, '%Y-%m-%d %H:%M:%S'), int(unique_key)
+    except ValueError:
+        return None
+
+def make_page_cursor(row):
+    """Page cursor pointing at a result row"""
+    return f"{row['created_date']:%Y-%m-%d %H:%M:%S}_{row['unique_key']}"
+
+def build_where_sql(filters):
+    """WHERE clause for a tuple of active filter names"""
+    return " AND ".join(SEARCH_FILTERS[name] for name in filters) if filters else "1=1"
+
+def fulltext_query(text):
+    """Boolean-mode MATCH query requiring every word as a prefix, None if a word is not indexed"""
+    words = re.findall(r'\w+', text)
+    if not words or any(len(w) < FULLTEXT_MIN_TOKEN_SIZE or w.lower() in FULLTEXT_STOPWORDS
+                        for w in words):
+        return None
+    return " ".join(f"+{w}*" for w in words)
 
 @app.route('/')
 def index():
@@ -26,55 +172,46 @@ def index():
     borough = request.args.get('borough', '')
     complaint_type = request.args.get('complaint_type', '')
     page = int(request.args.get('page', 1))
-    per_page = 50
-
-    conn = get_db_connection()
-    cursor = conn.cursor()
+    after = parse_page_cursor(request.args.get('after', ''))
+    before = parse_page_cursor(request.args.get('before', ''))
+    per_page = PAGE_SIZE
 
-    # Build WHERE clause dynamically
-    where_clauses = []
-    params = []
+    # Collect active filters -> bound values (SQL fragments live in SEARCH_FILTERS)
+    filters = {}
 
     if date_from:
-        where_clauses.append("created_date >= %s")
-        params.append(date_from)
+        filters['date_from'] = date_from
     if date_to:
-        where_clauses.append("created_date <= %s")
-        params.append(date_to)
+        filters['date_to'] = date_to
     if borough and borough != 'ALL':
-        where_clauses.append("borough = %s")
-        params.append(borough)
+        filters['borough'] = borough
     if complaint_type:
-        where_clauses.append("complaint_type LIKE %s")
-        params.append(f"%{complaint_type}%")
+        # FULLTEXT index lookup when possible - LIKE '%...%' always scans the table
+        match_query = fulltext_query(complaint_type)
+        if match_query:
+            filters['complaint_match'] = match_query
+        else:
+            filters['complaint_like'] = f"%{complaint_type}%"
 
-    where_sql = " AND ".join(where_clauses) if where_clauses else "1=1"
+    where_sql = build_where_sql(tuple(filters))
+    params = tuple(filters.values())
 
-    # Get total count for pagination
-    count_query = "SELECT COUNT(*) as total FROM service_requests WHERE " + where_sql
-    cursor.execute(count_query, params)
-    total_records = cursor.fetchone()['total']
+    # Get paginated results - Previous/Next links carry a keyset cursor, a bare
+    # page number (e.g. a bookmarked URL) falls back to OFFSET
+    if after or before:
+        results = fetch_requests_page(where_sql, params, per_page, after=after, before=before)
+    else:
+        offset = (page - 1) * per_page
+        results = fetch_requests_page(where_sql, params, per_page, offset)
+    # Cached per filter set, so flipping pages doesn't recount
+    total_records = count_requests(where_sql, params)
     total_pages = (total_records + per_page - 1) // per_page
 
-    # Get paginated results
-    offset = (page - 1) * per_page
-    data_query = """
-        SELECT unique_key, created_date, closed_date, agency, complaint_type,
-               descriptor, borough, latitude, longitude
-        FROM service_requests
-        WHERE """ + where_sql + """
-        ORDER BY created_date DESC
-        LIMIT %s OFFSET %s
-    """
-    cursor.execute(data_query, params + [per_page, offset])
-    results = cursor.fetchall()
+    prev_cursor = make_page_cursor(results[0]) if results else None
+    next_cursor = make_page_cursor(results[-1]) if results else None
 
     # Get distinct boroughs for dropdown
-    cursor.execute("SELECT DISTINCT borough FROM service_requests ORDER BY borough")
-    boroughs = [row['borough'] for row in cursor.fetchall()]
-
-    cursor.close()
-    conn.close()
+    boroughs = get_boroughs()
 
     return render_template('index.html',
                            results=results,
@@ -82,64 +219,47 @@ def index():
                            total_records=total_records,
                            page=page,
                            total_pages=total_pages,
+                           prev_cursor=prev_cursor,
+                           next_cursor=next_cursor,
                            date_from=date_from,
                            date_to=date_to,
                            borough=borough,
                            complaint_type=complaint_type)
 
 @app.route('/aggregate')
+@cache.cached(timeout=300)
 def aggregate():
-    """Aggregate view - complaints per borough"""
-    conn = get_db_connection()
-    cursor = conn.cursor()
-
-    # Get complaints per borough
-    cursor.execute("""
-        SELECT
-            borough,
-            COUNT(*) as total_complaints,
-            COUNT(CASE WHEN closed_date IS NOT NULL THEN 1 END) as closed_complaints,
-            COUNT(CASE WHEN closed_date IS NULL THEN 1 END) as open_complaints,
-            MIN(created_date) as earliest_complaint,
-            MAX(created_date) as latest_complaint
-        FROM service_requests
-        GROUP BY borough
-        ORDER BY total_complaints DESC
-    """)
-    borough_stats = cursor.fetchall()
-
-    # Get top complaint types
-    cursor.execute("""
-        SELECT
-            complaint_type,
-            COUNT(*) as count
-        FROM service_requests
-        WHERE complaint_type IS NOT NULL
-        GROUP BY complaint_type
-        ORDER BY count DESC
-        LIMIT 10
-    """)
-    top_complaints = cursor.fetchall()
-
-    # Get overall statistics
-    cursor.execute("""
-        SELECT
-            COUNT(*) as total,
-            COUNT(CASE WHEN closed_date IS NOT NULL THEN 1 END) as closed,
-            COUNT(CASE WHEN closed_date IS NULL THEN 1 END) as open,
-            COUNT(DISTINCT agency) as agencies,
-            COUNT(DISTINCT complaint_type) as complaint_types
-        FROM service_requests
-    """)
-    overall_stats = cursor.fetchone()
+    """Aggregate view - complaints per borough, read from the ETL's summary tables"""
+    with get_db_connection() as conn, conn.cursor() as cursor:
+        # Get complaints per borough
+        cursor.execute("SELECT * FROM agg_borough ORDER BY total_complaints DESC")
+        borough_stats = cursor.fetchall()
+
+        # Get top complaint types
+        cursor.execute("SELECT * FROM agg_complaint_types ORDER BY count DESC LIMIT 10")
+        top_complaints = cursor.fetchall()
 
-    cursor.close()
-    conn.close()
+        # Get overall statistics
+        cursor.execute("SELECT * FROM agg_overall")
+        overall_stats = cursor.fetchone()
 
     return render_template('aggregate.html',
                            borough_stats=borough_stats,
                            top_complaints=top_complaints,
                            overall_stats=overall_stats)
 
+@app.after_request
+def add_http_caching(response):
+    """Cache-Control + ETag so browsers/proxies reuse pages and revalidate with a 304"""
+    max_age = HTTP_CACHE_MAX_AGE.get(request.endpoint)
+    if max_age is None or response.status_code != 200:
+        return response
+
+    response.cache_control.public = True
+    response.cache_control.max_age = max_age
+    response.set_etag(hashlib.blake2b(response.get_data(), digest_size=16).hexdigest())
+    # Answers If-None-Match with an empty 304 when the page is unchanged
+    return response.make_conditional(request)
+
 if __name__ == '__main__':
-    app.run(host='0.0.0.0', port=5000, debug=True)
+    app.run(host='0.0.0.0', port=5000, debug=os.getenv('FLASK_DEBUG') == '1')
@@ -13,14 +13,39 @@ CREATE TABLE IF NOT EXISTS service_requests (
   longitude DECIMAL(9,6)
 );
 
--- Index 1: Speed up date range queries (most common filter)
-CREATE INDEX idx_created_date ON service_requests(created_date);
+-- Index 1: Speed up date range queries (most common filter) and keyset
+-- pagination - matches ORDER BY created_date DESC, unique_key DESC
+CREATE INDEX idx_created_key ON service_requests(created_date DESC, unique_key DESC);
 
--- Index 2: Speed up borough filtering (location-based queries)
-CREATE INDEX idx_borough ON service_requests(borough);
+-- Index 2: Borough filter with the search page's sort order - borough = ?
+-- plus date range / ORDER BY created_date DESC without a filesort
+CREATE INDEX idx_borough_created ON service_requests(borough, created_date DESC, unique_key DESC);
 
 -- Index 3: Speed up agency filtering (department-specific reports)
 CREATE INDEX idx_agency ON service_requests(agency);
 
--- Index 4: Composite index for common combined filters (date + borough)
-CREATE INDEX idx_date_borough ON service_requests(created_date, borough);
+-- Index 4: Word search on complaint type (MATCH ... AGAINST instead of LIKE '%...%')
+CREATE FULLTEXT INDEX idx_complaint_type_ft ON service_requests(complaint_type);
+
+-- Summary tables for the aggregate page - rebuilt by the ETL after each load
+CREATE TABLE IF NOT EXISTS agg_borough (
+  borough VARCHAR(32),
+  total_complaints BIGINT NOT NULL,
+  closed_complaints BIGINT NOT NULL,
+  open_complaints BIGINT NOT NULL,
+  earliest_complaint DATETIME,
+  latest_complaint DATETIME
+);
+
+CREATE TABLE IF NOT EXISTS agg_complaint_types (
+  complaint_type VARCHAR(128),
+  count BIGINT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS agg_overall (
+  total BIGINT NOT NULL,
+  closed BIGINT NOT NULL,
+  open BIGINT NOT NULL,
+  agencies BIGINT NOT NULL,
+  complaint_types BIGINT NOT NULL
+);
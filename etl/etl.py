@@ -1,9 +1,15 @@
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pa_csv
 import pymysql
+import redis
 import time
+import io
 import os
+import queue
+import tempfile
+import multiprocessing
 from datetime import datetime
-import numpy as np
 
 # Database configuration
 DB_CONFIG = {
@@ -14,114 +20,539 @@ DB_CONFIG = {
     'database': os.getenv('DB_NAME', 'nyc311')
 }
 
-CHUNK_SIZE = 10000
+# Bytes of CSV parsed per Arrow record batch (~50k rows of the 311 export)
+BLOCK_SIZE = 16 << 20
+# Blocks the kernel is asked to prefetch beyond the one being parsed
+READAHEAD_BLOCKS = 4
+# Summary tables behind the app's /aggregate page, rebuilt after every load
+SUMMARY_TABLES = {
+    'agg_borough': """
+        SELECT
+            borough,
+            COUNT(*) as total_complaints,
+            COUNT(CASE WHEN closed_date IS NOT NULL THEN 1 END) as closed_complaints,
+            COUNT(CASE WHEN closed_date IS NULL THEN 1 END) as open_complaints,
+            MIN(created_date) as earliest_complaint,
+            MAX(created_date) as latest_complaint
+        FROM service_requests
+        GROUP BY borough
+    """,
+    'agg_complaint_types': """
+        SELECT
+            complaint_type,
+            COUNT(*) as count
+        FROM service_requests
+        WHERE complaint_type IS NOT NULL
+        GROUP BY complaint_type
+    """,
+    'agg_overall': """
+        SELECT
+            COUNT(*) as total,
+            COUNT(CASE WHEN closed_date IS NOT NULL THEN 1 END) as closed,
+            COUNT(CASE WHEN closed_date IS NULL THEN 1 END) as open,
+            COUNT(DISTINCT agency) as agencies,
+            COUNT(DISTINCT complaint_type) as complaint_types
+        FROM service_requests
+    """
+}
+
+# Web app's Redis cache - cleared after a load so it stops serving old results
+REDIS_CONFIG = {
+    'host': os.getenv('REDIS_HOST', 'localhost'),
+    'port': int(os.getenv('REDIS_PORT', 6379)),
+    'socket_connect_timeout': 2
+}
+CACHE_KEY_PREFIX = 'nyc311:'
+
 CSV_FILE = 'data/data_311_Jan_2025.csv'
 
+# Loader processes, each with its own MySQL connection
+WORKERS = int(os.getenv('ETL_WORKERS', os.cpu_count() or 1))
+# Chunks parsed ahead of the loaders - bounds memory when parsing outruns inserts
+QUEUE_SIZE = 4
+# Rows each loader writes per transaction
+COMMIT_ROWS = 200000
+
+# Low-cardinality text columns - dictionary-encoded by Arrow and handed to
+# pandas as categoricals, so each distinct string is stored once per chunk
+DICTIONARY_COLUMNS = ['Agency', 'Complaint Type', 'Descriptor', 'Borough']
+
+# CSV column -> service_requests column, in table load order
+COLUMN_MAP = {
+    'Unique Key': 'unique_key',
+    'Created Date': 'created_date',
+    'Closed Date': 'closed_date',
+    'Agency': 'agency',
+    'Complaint Type': 'complaint_type',
+    'Descriptor': 'descriptor',
+    'Borough': 'borough',
+    'Latitude': 'latitude',
+    'Longitude': 'longitude'
+}
+
+# Marker written for NULL cells in the temp CSV handed to LOAD DATA
+NULL_MARKER = '\\N'
+
+# Columns overwritten when a row's unique_key already exists
+UPDATE_COLUMNS = [col for col in COLUMN_MAP.values() if col != 'unique_key']
+
+# Per-connection staging table for LOAD DATA (same columns, no indexes)
+STAGE_TABLE_SQL = (
+    "CREATE TEMPORARY TABLE IF NOT EXISTS service_requests_stage "
+    "SELECT * FROM service_requests LIMIT 0"
+)
+
+# Bulk load - MySQL parses the CSV server-side instead of one statement per row.
+# Every column goes through a user variable so the NULL marker can be mapped
+# back to SQL NULL (ESCAPED BY '' keeps backslashes in the data intact).
+LOAD_DATA_SQL = (
+    "LOAD DATA LOCAL INFILE %s INTO TABLE service_requests_stage "
+    "FIELDS TERMINATED BY ',' ENCLOSED BY '\"' ESCAPED BY '' "
+    "LINES TERMINATED BY '\\n' "
+    "(" + ", ".join('@' + col for col in COLUMN_MAP.values()) + ") "
+    "SET " + ", ".join(f"{col} = NULLIF(@{col}, '\\\\N')" for col in COLUMN_MAP.values())
+)
+
+# Upsert the staged chunk - unlike REPLACE, an existing row is updated in place
+# instead of deleted and re-inserted (with every index entry along with it)
+MERGE_STAGE_SQL = (
+    "INSERT INTO service_requests (" + ", ".join(COLUMN_MAP.values()) + ") "
+    "SELECT " + ", ".join(COLUMN_MAP.values()) + " FROM service_requests_stage AS stage "
+    "ON DUPLICATE KEY UPDATE " + ", ".join(f"{col} = stage.{col}" for col in UPDATE_COLUMNS)
+)
+
+# Fallback when the server refuses LOAD DATA LOCAL - pymysql rewrites
+# executemany() on this statement into multi-row INSERT ... VALUES batches
+INSERT_SQL = (
+    "INSERT INTO service_requests (" + ", ".join(COLUMN_MAP.values()) + ") "
+    "VALUES (" + ", ".join(['%s'] * len(COLUMN_MAP)) + ") AS new "
+    "ON DUPLICATE KEY UPDATE " + ", ".join(f"{col} = new.{col}" for col in UPDATE_COLUMNS)
+)
+
+# ER_NOT_ALLOWED_COMMAND / ER_CLIENT_LOCAL_FILES_DISABLED
+LOCAL_INFILE_DISABLED_ERRORS = (1148, 3948)
+
+# FULLTEXT index behind the app's complaint type search (see db/schema.sql)
+FULLTEXT_INDEX_SQL = "CREATE FULLTEXT INDEX idx_complaint_type_ft ON service_requests(complaint_type)"
+
+# Session settings for loader connections - skip secondary unique/FK checks during the
+# bulk load, and make sure strict mode is on so a value that doesn't fit its column
+# fails the INSERT (and the row is skipped) instead of being silently truncated
+LOAD_SESSION_SQL = (
+    "SET unique_checks = 0, foreign_key_checks = 0, "
+    "sql_mode = CONCAT_WS(',', NULLIF(@@SESSION.sql_mode, ''), 'STRICT_TRANS_TABLES')"
+)
+
+# Bad rows shown per chunk (the rest are only counted)
+MAX_ROW_ERRORS = 10
+
+class ReadaheadFile(io.FileIO):
+    """CSV file that asks the kernel to prefetch the next blocks on every read.
+
+    A single WILLNEED on the whole file is capped at the device readahead
+    window, so the hint is re-issued just ahead of the parser as it moves.
+    """
+    def read(self, size=-1):
+        os.posix_fadvise(self.fileno(), self.tell() + BLOCK_SIZE,
+                         READAHEAD_BLOCKS * BLOCK_SIZE, os.POSIX_FADV_WILLNEED)
+        return super().read(size)
+
+def open_csv_stream(csv_file):
+    """Open the CSV for block reads, with the kernel prefetching it ahead of the parser"""
+    if hasattr(os, 'posix_fadvise'):
+        return ReadaheadFile(csv_file)
+    # One read() per block instead of many small ones
+    return pa.input_stream(csv_file, buffer_size=BLOCK_SIZE)
+
+def read_chunks(csv_file):
+    """Stream the CSV as DataFrames using Arrow's multithreaded C++ parser"""
+    with open_csv_stream(csv_file) as stream:
+        reader = pa_csv.open_csv(
+            stream,
+            read_options=pa_csv.ReadOptions(block_size=BLOCK_SIZE),
+            convert_options=pa_csv.ConvertOptions(
+                # Only parse the columns we load; the export has ~40
+                include_columns=list(COLUMN_MAP),
+                include_missing_columns=True,
+                # Read as text - clean_data coerces bad dates/coordinates to NULL
+                # instead of Arrow failing the whole batch
+                column_types={
+                    col: pa.dictionary(pa.int32(), pa.string()) if col in DICTIONARY_COLUMNS else pa.string()
+                    for col in COLUMN_MAP
+                },
+                null_values=[''],
+                strings_can_be_null=True
+            )
+        )
+        for batch in reader:
+            # self_destruct frees each Arrow column as pandas takes it over, so a
+            # chunk is not held in memory twice
+            table = pa.Table.from_batches([batch])
+            del batch
+            yield table.to_pandas(split_blocks=True, self_destruct=True)
+
 def clean_data(df):
-    """Clean and transform the data"""
-    # Fix missing boroughs - handle if column exists
-    if 'Borough' in df.columns:
-        df['Borough'] = df['Borough'].fillna('UNKNOWN').replace('', 'UNKNOWN')
-
-    # Handle dates - convert to datetime, invalid dates become NaT (NULL in SQL)
-    if 'Created Date' in df.columns:
-        df['Created Date'] = pd.to_datetime(df['Created Date'], errors='coerce')
-    if 'Closed Date' in df.columns:
-        df['Closed Date'] = pd.to_datetime(df['Closed Date'], errors='coerce')
-
-    # Handle missing coordinates
-    if 'Latitude' in df.columns:
-        df['Latitude'] = pd.to_numeric(df['Latitude'], errors='coerce')
-    if 'Longitude' in df.columns:
-        df['Longitude'] = pd.to_numeric(df['Longitude'], errors='coerce')
-
-    # Replace NaN with None for proper NULL handling in MySQL
-    df = df.replace({np.nan: None})
+    """Clean and transform the data into service_requests columns"""
+    # Keep only the loaded columns, renamed to their DB names (missing columns become NULL)
+    df = df.reindex(columns=list(COLUMN_MAP)).rename(columns=COLUMN_MAP)
+
+    # Fix missing boroughs (as plain strings - UNKNOWN may not be a category)
+    df['borough'] = df['borough'].astype(object).fillna('UNKNOWN').replace('', 'UNKNOWN')
+
+    # Handle dates - invalid dates become NULL. numpy casts datetime64[s] to
+    # datetime.datetime (pymysql's native type) and NaT to None in one pass,
+    # so no per-cell conversion is needed downstream
+    for col in ('created_date', 'closed_date'):
+        dates = pd.to_datetime(df[col], errors='coerce').to_numpy(dtype='datetime64[s]')
+        df[col] = pd.Series(dates.astype(object), index=df.index, dtype=object)
+
+    # Rows without a key or creation date can't be loaded (both are NOT NULL) -
+    # drop them here so LOAD DATA never coerces them to 0 / a zero date
+    df['unique_key'] = pd.to_numeric(df['unique_key'], errors='coerce')
+    df = df[df['unique_key'].notna() & df['created_date'].notna()].astype({'unique_key': 'int64'})
+
+    # Handle missing coordinates - rounded to the DECIMAL(9,6) column scale, the
+    # export carries 11-14 decimal places
+    df['latitude'] = pd.to_numeric(df['latitude'], errors='coerce').round(6)
+    df['longitude'] = pd.to_numeric(df['longitude'], errors='coerce').round(6)
+
+    # Replace NaN/NaT with None for proper NULL handling in MySQL - one pass over the frame
+    df = df.astype(object).where(df.notna(), None)
 
     return df
 
-def safe_value(val):
-    """Convert pandas NaN/NaT to Python None for MySQL"""
-    if pd.isna(val):
+def load_chunk(cursor, df):
+    """Bulk load a cleaned chunk via LOAD DATA LOCAL INFILE into staging, then upsert (idempotent).
+
+    Returns the number of rows rejected as invalid.
+    """
+    tmp = tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False, newline='')
+    try:
+        with tmp:
+            df.to_csv(tmp, index=False, header=False, na_rep=NULL_MARKER, lineterminator='\n')
+        cursor.execute(STAGE_TABLE_SQL)
+        cursor.execute(LOAD_DATA_SQL, (tmp.name,))
+        # LOAD DATA LOCAL implies IGNORE - values that don't fit become warnings
+        # instead of errors. Notes (e.g. rounding) are harmless; on a real warning
+        # the chunk goes through the strict INSERT path so only bad rows are skipped
+        cursor.execute("SHOW WARNINGS")
+        if any(level != 'Note' for level, _, _ in cursor.fetchall()):
+            cursor.execute("DELETE FROM service_requests_stage")
+            return insert_chunk(cursor, df)
+        cursor.execute(MERGE_STAGE_SQL)
+        cursor.execute("DELETE FROM service_requests_stage")
+        return 0
+    finally:
+        os.remove(tmp.name)
+
+def insert_chunk(cursor, df):
+    """Upsert a cleaned chunk with batched multi-row INSERT ... ON DUPLICATE KEY UPDATE (idempotent).
+
+    Returns the number of rows rejected as invalid.
+    """
+    records = df.to_numpy().tolist()
+    try:
+        cursor.executemany(INSERT_SQL, records)
+        return 0
+    except (pymysql.err.DataError, pymysql.err.IntegrityError):
+        # One bad row fails its whole batch - redo the chunk row by row (the
+        # upsert makes rows already written harmless) and skip only the bad ones
+        return insert_rows(cursor, records)
+
+def insert_rows(cursor, records):
+    """Upsert records one at a time, skipping rows MySQL rejects; returns the rejected count"""
+    rejected = 0
+    for record in records:
+        try:
+            cursor.execute(INSERT_SQL, record)
+        except (pymysql.err.DataError, pymysql.err.IntegrityError) as e:
+            rejected += 1
+            if rejected <= MAX_ROW_ERRORS:
+                print(f"  Skipped row {record[0]}: {e}")
+    return rejected
+
+def get_secondary_indexes(cursor):
+    """Return {index name: ADD clause} for the droppable indexes on service_requests"""
+    cursor.execute("SHOW INDEX FROM service_requests")
+    columns = {}
+    kinds = {}
+    for row in cursor.fetchall():
+        # Unique indexes stay - the upsert relies on them; so do FULLTEXT indexes,
+        # the app's MATCH() searches fail without them
+        if row['Key_name'] == 'PRIMARY' or not row['Non_unique'] or row['Index_type'] == 'FULLTEXT':
+            continue
+        part = f"`{row['Column_name']}`" if row['Column_name'] else f"({row['Expression']})"
+        if row['Sub_part']:
+            part += f"({row['Sub_part']})"
+        if row['Collation'] == 'D':
+            part += " DESC"
+        columns.setdefault(row['Key_name'], []).append((row['Seq_in_index'], part))
+        kinds[row['Key_name']] = 'SPATIAL' if row['Index_type'] == 'SPATIAL' else ''
+
+    return {
+        name: f"{kinds[name]} INDEX `{name}` ({', '.join(part for _, part in sorted(parts))})".strip()
+        for name, parts in columns.items()
+    }
+
+def drop_indexes(cursor, indexes):
+    """Drop secondary indexes so the bulk load does not maintain their B-trees"""
+    if indexes:
+        cursor.execute("ALTER TABLE service_requests " +
+                       ", ".join(f"DROP INDEX `{name}`" for name in indexes))
+
+def rebuild_indexes(cursor, indexes):
+    """Recreate dropped indexes after the load"""
+    # All indexes are built together in one ALTER - one table scan, with the
+    # sorts run in parallel by innodb_ddl_threads
+    if indexes:
+        statement = "ALTER TABLE service_requests " + ", ".join(f"ADD {c}" for c in indexes.values())
+        print(f"  {statement}")
+        cursor.execute(statement)
+
+def ensure_fulltext_index(cursor):
+    """Create the complaint_type FULLTEXT index if missing; True if it was created"""
+    # The app's complaint search uses MATCH(), which fails without it - databases
+    # created from an older schema.sql don't have it
+    cursor.execute("SHOW INDEX FROM service_requests "
+                   "WHERE Index_type = 'FULLTEXT' AND Column_name = 'complaint_type'")
+    if cursor.fetchall():
+        return False
+    cursor.execute(FULLTEXT_INDEX_SQL)
+    return True
+
+def refresh_summaries(cursor):
+    """Rebuild the aggregate summary tables, swapping each in atomically"""
+    for table, query in SUMMARY_TABLES.items():
+        cursor.execute(f"DROP TABLE IF EXISTS {table}_new, {table}_old")
+        cursor.execute(f"CREATE TABLE {table}_new AS {query}")
+        # RENAME needs an existing table to swap out (databases created before the summaries)
+        cursor.execute(f"CREATE TABLE IF NOT EXISTS {table} LIKE {table}_new")
+        cursor.execute(f"RENAME TABLE {table} TO {table}_old, {table}_new TO {table}")
+        cursor.execute(f"DROP TABLE {table}_old")
+
+def clear_app_cache():
+    """Delete the web app's cached query results"""
+    try:
+        client = redis.Redis(**REDIS_CONFIG)
+        keys = list(client.scan_iter(match=CACHE_KEY_PREFIX + '*'))
+        if keys:
+            client.delete(*keys)
+        print(f"Cleared {len(keys)} cached app entries")
+    except redis.RedisError as e:
+        print(f"Could not clear app cache: {e}")
+
+def commit_pending(conn, pending, result_queue):
+    """Commit the open transaction and report its chunks as loaded (or failed)"""
+    try:
+        conn.commit()
+        for chunk_num, rows, skipped in pending:
+            result_queue.put((chunk_num, rows, skipped, None))
+    except Exception as e:
+        conn.rollback()
+        for chunk_num, rows, skipped in pending:
+            result_queue.put((chunk_num, 0, rows + skipped, f"commit failed: {e}"))
+    pending.clear()
+
+def load_worker(task_queue, result_queue):
+    """Clean and load chunks from the task queue until a None sentinel arrives"""
+    conn = None
+    use_load_data = True
+    # Chunks loaded since the last commit, as (chunk_num, rows, skipped rows)
+    pending = []
+    try:
+        conn = pymysql.connect(**DB_CONFIG, local_infile=True, init_command=LOAD_SESSION_SQL)
+    except Exception as e:
+        print(f"Worker {os.getpid()} could not connect: {e}")
+
+    while True:
+        task = task_queue.get()
+        if task is None:
+            break
+        chunk_num, chunk = task
+
+        # Without a connection keep draining the queue so the reader never blocks
+        if conn is None:
+            result_queue.put((chunk_num, 0, len(chunk), "no database connection"))
+            continue
+
+        cursor = conn.cursor()
+        read_rows = len(chunk)
+        try:
+            # Clean the data - rows missing unique_key/created_date are dropped and counted as failed
+            chunk = clean_data(chunk)
+            dropped = read_rows - len(chunk)
+
+            # Load data (idempotent upsert on unique_key); rows MySQL rejects are
+            # skipped and counted as failed, on either path
+            rejected = None
+            if use_load_data:
+                try:
+                    rejected = load_chunk(cursor, chunk)
+                except pymysql.err.OperationalError as e:
+                    if e.args[0] not in LOCAL_INFILE_DISABLED_ERRORS:
+                        raise
+                    print(f"  LOAD DATA LOCAL unavailable ({e}), falling back to batched inserts")
+                    use_load_data = False
+            if rejected is None:
+                rejected = insert_chunk(cursor, chunk)
+            pending.append((chunk_num, len(chunk) - rejected, dropped + rejected))
+        except Exception as e:
+            # The rollback also discards the chunks waiting on the next commit
+            conn.rollback()
+            for pending_num, rows, skipped in pending:
+                result_queue.put((pending_num, 0, rows + skipped, f"rolled back with chunk {chunk_num}"))
+            pending.clear()
+            result_queue.put((chunk_num, 0, read_rows, str(e)))
+        finally:
+            cursor.close()
+
+        # Commit every COMMIT_ROWS rows rather than every chunk - each commit is a redo log flush
+        if sum(rows for _, rows, _ in pending) >= COMMIT_ROWS:
+            commit_pending(conn, pending, result_queue)
+
+    if conn is not None:
+        commit_pending(conn, pending, result_queue)
+        conn.close()
+
+def set_log_flush(cursor, value):
+    """Set innodb_flush_log_at_trx_commit, returning the previous value (None if not permitted)"""
+    try:
+        cursor.execute("SELECT @@GLOBAL.innodb_flush_log_at_trx_commit as value")
+        previous = cursor.fetchone()['value']
+        cursor.execute("SET GLOBAL innodb_flush_log_at_trx_commit = %s", (value,))
+        return previous
+    except pymysql.MySQLError as e:
+        print(f"Could not set innodb_flush_log_at_trx_commit: {e}")
         return None
-    return val
 
 def main():
     print("Starting ETL process...")
     start_time = time.time()
 
-    # Connect to database
-    conn = pymysql.connect(**DB_CONFIG)
-    cursor = conn.cursor()
-
     total_rows = 0
     chunk_num = 0
     error_count = 0
 
+    conn = pymysql.connect(**DB_CONFIG, cursorclass=pymysql.cursors.DictCursor)
+    cursor = conn.cursor()
+    indexes = get_secondary_indexes(cursor)
+    dropped_indexes = {}
+    previous_log_flush = None
+    workers = []
+    # Whatever happens during the load, the indexes and the flush setting are put back
     try:
-        # First, peek at the CSV to see column names
-        sample_df = pd.read_csv(CSV_FILE, nrows=1)
-        print(f"CSV Columns: {list(sample_df.columns)}")
-        print()
+        # Drop secondary indexes for the duration of the load (one ALTER - all or none)
+        print(f"Dropping indexes for load: {list(indexes)}")
+        drop_indexes(cursor, indexes)
+        dropped_indexes = indexes
 
-        # Read CSV in chunks
-        for chunk in pd.read_csv(CSV_FILE, chunksize=CHUNK_SIZE):
-            chunk_num += 1
-            print(f"Processing chunk {chunk_num} ({len(chunk)} rows)...")
+        # Flush the redo log about once a second instead of at every commit. It is a
+        # global setting (no session scope), restored after the load; a crash can
+        # lose the last second of rows, which re-running this idempotent ETL restores
+        previous_log_flush = set_log_flush(cursor, 2)
 
-            # Clean the data
-            chunk = clean_data(chunk)
+        # Start loader processes; the main process only parses the CSV
+        task_queue = multiprocessing.Queue(maxsize=QUEUE_SIZE)
+        result_queue = multiprocessing.Queue()
+        workers = [multiprocessing.Process(target=load_worker, args=(task_queue, result_queue))
+                   for _ in range(WORKERS)]
+        for worker in workers:
+            worker.start()
 
-            # Insert data (idempotent with REPLACE)
-            for _, row in chunk.iterrows():
-                try:
-                    cursor.execute("""
-                        REPLACE INTO service_requests
-                        (unique_key, created_date, closed_date, agency, complaint_type,
-                         descriptor, borough, latitude, longitude)
-                        VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
-                    """, (
-                        safe_value(row.get('Unique Key')),
-                        safe_value(row.get('Created Date')),
-                        safe_value(row.get('Closed Date')),
-                        safe_value(row.get('Agency')),
-                        safe_value(row.get('Complaint Type')),
-                        safe_value(row.get('Descriptor')),
-                        safe_value(row.get('Borough', 'UNKNOWN')),
-                        safe_value(row.get('Latitude')),
-                        safe_value(row.get('Longitude'))
-                    ))
-                except Exception as e:
-                    error_count += 1
-                    if error_count <= 10:  # Only print first 10 errors
-                        print(f"Error inserting row {safe_value(row.get('Unique Key'))}: {e}")
-                    continue
-
-            conn.commit()
-            total_rows += len(chunk)
-            print(f"  Inserted {len(chunk)} rows (Total: {total_rows})")
-
-        # Calculate statistics
-        end_time = time.time()
-        duration = end_time - start_time
-        rows_per_sec = total_rows / duration if duration > 0 else 0
-
-        print("\n" + "="*50)
-        print("ETL COMPLETE - Statistics:")
-        print(f"  Total rows processed: {total_rows}")
-        print(f"  Errors encountered: {error_count}")
-        print(f"  Duration: {duration:.2f} seconds")
-        print(f"  Speed: {rows_per_sec:.2f} rows/second")
-        print("="*50)
+        try:
+            # First, peek at the CSV to see column names
+            sample_df = pd.read_csv(CSV_FILE, nrows=1)
+            print(f"CSV Columns: {list(sample_df.columns)}")
+            print(f"Loading columns: {list(COLUMN_MAP)}")
+            print(f"Loader processes: {WORKERS}")
+            print()
+
+            # Read CSV in chunks - put() blocks while the queue is full
+            for chunk in read_chunks(CSV_FILE):
+                chunk_num += 1
+                print(f"Processing chunk {chunk_num} ({len(chunk)} rows)...")
+                task_queue.put((chunk_num, chunk))
+
+        except Exception as e:
+            print(f"Error during ETL: {e}")
+            import traceback
+            traceback.print_exc()
+        finally:
+            for _ in workers:
+                task_queue.put(None)
 
+        # Collect one result per queued chunk
+        finished = 0
+        while finished < chunk_num:
+            try:
+                done_chunk, inserted, failed, error = result_queue.get(timeout=1)
+            except queue.Empty:
+                if not any(worker.is_alive() for worker in workers):
+                    print("Loader processes exited before all chunks were reported")
+                    break
+                continue
+            finished += 1
+            total_rows += inserted
+            error_count += failed
+            if error:
+                print(f"Error loading chunk {done_chunk}: {error}")
+            else:
+                print(f"  Inserted chunk {done_chunk}: {inserted} rows (Total: {total_rows})")
+                if failed:
+                    print(f"  Skipped {failed} invalid rows in chunk {done_chunk}")
+
+        for worker in workers:
+            worker.join()
+    finally:
+        # Loaders left running by an interrupted load would hold the ALTER below
+        for worker in workers:
+            if worker.is_alive():
+                worker.terminate()
+
+        if previous_log_flush is not None:
+            set_log_flush(cursor, previous_log_flush)
+
+        # Rebuild indexes even if the load failed part-way
+        index_start = time.time()
+        print("\nRebuilding indexes...")
+        try:
+            rebuild_indexes(cursor, dropped_indexes)
+            print(f"  Rebuilt {len(dropped_indexes)} indexes in {time.time() - index_start:.2f} seconds")
+        except Exception as e:
+            print(f"Error rebuilding indexes: {e}")
+
+        # Built after the load so the rows are indexed in one pass
+        try:
+            if ensure_fulltext_index(cursor):
+                print("  Created FULLTEXT index idx_complaint_type_ft")
+        except Exception as e:
+            print(f"Error creating FULLTEXT index: {e}")
+
+    # Materialize the /aggregate counters so the page reads a few summary rows
+    print("Refreshing summary tables...")
+    try:
+        refresh_summaries(cursor)
+        print(f"  Refreshed {', '.join(SUMMARY_TABLES)}")
     except Exception as e:
-        print(f"Error during ETL: {e}")
-        import traceback
-        traceback.print_exc()
-        conn.rollback()
+        print(f"Error refreshing summary tables: {e}")
     finally:
         cursor.close()
         conn.close()
 
+    clear_app_cache()
+
+    # Calculate statistics
+    end_time = time.time()
+    duration = end_time - start_time
+    rows_per_sec = total_rows / duration if duration > 0 else 0
+
+    print("\n" + "="*50)
+    print("ETL COMPLETE - Statistics:")
+    print(f"  Total rows processed: {total_rows}")
+    print(f"  Errors encountered: {error_count}")
+    print(f"  Duration: {duration:.2f} seconds")
+    print(f"  Speed: {rows_per_sec:.2f} rows/second")
+    print("="*50)
+
 if __name__ == "__main__":
     main()
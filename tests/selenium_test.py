@@ -5,7 +5,6 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.support.ui import Select
-import time
 
 BASE_URL = "http://localhost:5000"
 
@@ -18,8 +17,8 @@ def driver():
     chrome_options.add_argument("--disable-dev-shm-usage")
     chrome_options.add_argument("--disable-gpu")
 
+    # No implicit wait - it compounds with the explicit WebDriverWaits below
     driver = webdriver.Chrome(options=chrome_options)
-    driver.implicitly_wait(10)
 
     yield driver
 
@@ -63,8 +62,8 @@ class TestSearchPage:
             submit_btn = driver.find_element(By.CSS_SELECTOR, "button[type='submit']")
             submit_btn.click()
 
-            # Wait for page to load
-            time.sleep(2)
+            # Wait for the filtered page to load
+            WebDriverWait(driver, 5).until(EC.url_contains("borough="))
 
             # Verify URL contains borough parameter
             assert "borough=" in driver.current_url
@@ -82,14 +81,98 @@ class TestSearchPage:
         submit_btn = driver.find_element(By.CSS_SELECTOR, "button[type='submit']")
         submit_btn.click()
 
-        # Wait for page to load
-        time.sleep(2)
+        # Wait for the empty result page to load
+        WebDriverWait(driver, 5).until(EC.any_of(
+            EC.text_to_be_present_in_element((By.CLASS_NAME, "stats"), "Total Records Found: 0"),
+            EC.presence_of_element_located((By.XPATH, "//*[contains(text(), 'No results found')]"))
+        ))
 
         # Verify no results or zero count
         page_text = driver.page_source
         assert ("No results found" in page_text or
                 "Total Records Found: 0" in driver.find_element(By.CLASS_NAME, "stats").text)
 
+    def test_complaint_type_word_search(self, driver):
+        """Positive test: A whole word finds every complaint type containing it (FULLTEXT search)"""
+        driver.get(BASE_URL)
+
+        complaint_type = driver.find_element(By.NAME, "complaint_type")
+        complaint_type.send_keys("Noise")
+
+        # The home page already lists results - wait for it to be replaced
+        old_stats = driver.find_element(By.CLASS_NAME, "stats")
+        submit_btn = driver.find_element(By.CSS_SELECTOR, "button[type='submit']")
+        submit_btn.click()
+
+        wait = WebDriverWait(driver, 5)
+        wait.until(EC.staleness_of(old_stats))
+        wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, "tbody tr")))
+
+        # The fixture has several "Noise - ..." complaints, and only those match
+        rows = driver.find_elements(By.CSS_SELECTOR, "tbody tr")
+        assert len(rows) > 1
+        for row in rows:
+            assert "Noise" in row.find_elements(By.TAG_NAME, "td")[4].text
+
+    def test_complaint_type_substring_search(self, driver):
+        """Positive test: Text with a word too short to index falls back to a substring match"""
+        driver.get(BASE_URL)
+
+        # "ot" is below the FULLTEXT minimum word length, so this runs as LIKE '%ot Wat%'
+        complaint_type = driver.find_element(By.NAME, "complaint_type")
+        complaint_type.send_keys("ot Wat")
+
+        # The home page already lists results - wait for it to be replaced
+        old_stats = driver.find_element(By.CLASS_NAME, "stats")
+        submit_btn = driver.find_element(By.CSS_SELECTOR, "button[type='submit']")
+        submit_btn.click()
+
+        wait = WebDriverWait(driver, 5)
+        wait.until(EC.staleness_of(old_stats))
+        wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, "tbody tr")))
+
+        # Matches inside the word "Hot" of the fixture's "Heat/Hot Water" complaint
+        rows = driver.find_elements(By.CSS_SELECTOR, "tbody tr")
+        assert len(rows) == 1
+        assert rows[0].find_elements(By.TAG_NAME, "td")[4].text == "Heat/Hot Water"
+
+    def test_pagination_next_and_previous(self, driver):
+        """Test that Next moves on to older rows and Previous returns to the first page"""
+        driver.get(BASE_URL)
+
+        # Needs more rows than one page - CI runs the app with a small PAGE_SIZE
+        next_links = driver.find_elements(By.LINK_TEXT, "Next")
+        if not next_links:
+            pytest.skip("All rows fit on one page - run the app with a smaller PAGE_SIZE")
+
+        # Unique keys (first column) of the current page, newest first
+        def page_keys():
+            return [int(row.find_element(By.TAG_NAME, "td").text)
+                    for row in driver.find_elements(By.CSS_SELECTOR, "tbody tr")]
+
+        first_page = page_keys()
+        wait = WebDriverWait(driver, 5)
+
+        # Next - a keyset cursor continues right after the last row of page 1
+        old_stats = driver.find_element(By.CLASS_NAME, "stats")
+        next_links[0].click()
+        wait.until(EC.staleness_of(old_stats))
+        wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, "tbody tr")))
+
+        assert "after=" in driver.current_url
+        second_page = page_keys()
+        assert second_page
+        assert max(second_page) < min(first_page)
+
+        # Previous - walks back from the first row of page 2 to the same first page
+        old_stats = driver.find_element(By.CLASS_NAME, "stats")
+        driver.find_element(By.LINK_TEXT, "Previous").click()
+        wait.until(EC.staleness_of(old_stats))
+        wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, "tbody tr")))
+
+        assert "before=" in driver.current_url
+        assert page_keys() == first_page
+
 
 class TestAggregatePage:
     """Tests for the aggregate statistics page"""
@@ -183,6 +266,7 @@ class TestNavigation:
         # Click aggregate link
         aggregate_link = driver.find_element(By.LINK_TEXT, "Aggregate Stats")
         aggregate_link.click()
+        WebDriverWait(driver, 5).until(EC.title_contains("Aggregate Statistics"))
 
         # Verify we're on aggregate page
         assert "/aggregate" in driver.current_url
@@ -195,6 +279,7 @@ class TestNavigation:
         # Click search link
         search_link = driver.find_element(By.LINK_TEXT, "Search")
         search_link.click()
+        WebDriverWait(driver, 5).until(EC.title_is("NYC 311 Service Requests"))
 
         # Verify we're back on search page
         assert driver.current_url == f"{BASE_URL}/" or driver.current_url == BASE_URL